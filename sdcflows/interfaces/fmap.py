@@ -89,10 +89,9 @@ class SubtractPhases(SimpleInterface):
 
         from ..utils.phasemanip import subtract_phases as _subtract_phases
 
-        # Discard in_meta traits with copy(), so that pop() works.
         self._results["phase_diff"], self._results["metadata"] = _subtract_phases(
             self.inputs.in_phases,
-            (self.inputs.in_meta[0].copy(), self.inputs.in_meta[1].copy()),
+            self.inputs.in_meta,
             newpath=runtime.cwd,
         )
 
@@ -147,10 +146,19 @@ class CheckB0Units(SimpleInterface):
             self.inputs.in_file, suffix="_Hz", newpath=runtime.cwd
         )
         img = nb.load(self.inputs.in_file)
-        data = np.asanyarray(img.dataobj) / (2.0 * np.pi)
-        img.__class__(data, img.affine, img.header).to_filename(
-            self._results["out_file"]
-        )
+
+        if np.issubdtype(img.get_data_dtype(), np.integer):
+            # Fold the conversion into the scaling factors, voxels are not touched
+            slope, inter = img.dataobj.slope, img.dataobj.inter
+            out_img = img.__class__(img.dataobj.get_unscaled(), img.affine, img.header)
+            out_img.header.set_slope_inter(slope / (2.0 * np.pi), inter / (2.0 * np.pi))
+        else:
+            data = img.get_fdata(dtype="float32")
+            data /= 2.0 * np.pi
+            out_img = img.__class__(data, img.affine, img.header)
+            out_img.set_data_dtype("float32")
+
+        out_img.to_filename(self._results["out_file"])
         return runtime
 
 
@@ -190,14 +198,10 @@ class DisplacementsField2Fieldmap(SimpleInterface):
         )
 
         if self.inputs.demean:
+            # The fieldmap is an in-memory float32 array: demean it in place,
+            # without re-creating the image.
             data = np.asanyarray(fmapnii.dataobj)
             data -= np.median(data)
 
-            fmapnii = fmapnii.__class__(
-                data.astype("float32"),
-                fmapnii.affine,
-                fmapnii.header,
-            )
-
         fmapnii.to_filename(self._results["out_file"])
         return runtime
@@ -25,7 +25,7 @@ import numpy as np
 import nibabel as nb
 import pytest
 
-from ..fmap import CheckB0Units
+from ..fmap import CheckB0Units, DisplacementsField2Fieldmap
 
 
 @pytest.mark.parametrize("units", ("rad/s", "Hz"))
@@ -44,3 +44,48 @@ def test_units(tmpdir, units):
     ).get_fdata(dtype="float32")
 
     assert np.allclose(hz, out_data)
+
+
+def test_units_integer(tmpdir):
+    """Check the conversion of integer fieldmaps is only encoded in the header."""
+    tmpdir.chdir()
+    data = np.arange(125, dtype="int16").reshape((5, 5, 5))
+    img = nb.Nifti1Image(data, np.eye(4), None)
+    img.header.set_slope_inter(2.0 * np.pi, 0.0)
+    img.to_filename("data.nii.gz")
+
+    out_img = nb.load(
+        CheckB0Units(units="rad/s", in_file="data.nii.gz").run().outputs.out_file
+    )
+
+    assert out_img.get_data_dtype() == np.int16
+    assert np.array_equal(np.asanyarray(out_img.dataobj.get_unscaled()), data)
+    assert np.allclose(out_img.get_fdata(dtype="float32"), data)
+
+
+@pytest.mark.parametrize("demean", (True, False))
+def test_displacements_field(tmpdir, demean):
+    """Check the extraction of a fieldmap from a displacements field."""
+    tmpdir.chdir()
+    rng = np.random.default_rng(1234)
+    vsm = rng.normal(size=(5, 5, 5)).astype("float32")
+    xyz = np.zeros((5, 5, 5, 1, 3), dtype="float32")
+    xyz[..., 0, 1] = vsm
+    nb.Nifti1Image(xyz, np.eye(4), None).to_filename("xfm.nii.gz")
+
+    out_img = nb.load(
+        DisplacementsField2Fieldmap(
+            transform="xfm.nii.gz",
+            ro_time=0.5,
+            pe_dir="j",
+            itk_transform=False,
+            demean=demean,
+        ).run().outputs.out_file
+    )
+
+    expected = vsm / 0.5
+    if demean:
+        expected -= np.median(expected)
+
+    assert out_img.get_data_dtype() == np.float32
+    assert np.allclose(out_img.get_fdata(dtype="float32"), expected, atol=1e-5)
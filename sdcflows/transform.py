@@ -304,23 +304,29 @@ def disp_to_fmap(xyz_nii, ro_time, pe_dir, itk_format=True):
         A NIfTI 1.0 object containing the field in Hz.
 
     """
-    xyz_deltas = np.squeeze(xyz_nii.get_fdata(dtype="float32")).reshape((-1, 3))
-
-    if itk_format:
-        # ITK displacement vectors are in LPS orientation
-        xyz_deltas[:, (0, 1)] *= -1
-
-    inv_aff = np.linalg.inv(xyz_nii.affine)
-    inv_aff[:3, 3] = 0  # Translations MUST NOT be applied.
+    # Do not keep a cached copy of the (large) displacements field around
+    xyz_deltas = np.squeeze(
+        xyz_nii.get_fdata(dtype="float32", caching="unchanged")
+    ).reshape((-1, 3))
 
     # Convert displacements from mm to voxel units
     # Using the inverse affine accounts for reordering of axes, etc.
-    ijk_deltas = nb.affines.apply_affine(inv_aff, xyz_deltas).astype("float32")
+    # Only the row of the PE axis is necessary, and translations MUST NOT be applied.
     pe_axis = "ijk".index(pe_dir[0])
-    vsm = ijk_deltas[:, pe_axis].reshape(xyz_nii.shape[:3])
+    inv_row = np.linalg.inv(xyz_nii.affine)[pe_axis, :3]
+
+    if itk_format:
+        # ITK displacement vectors are in LPS orientation
+        inv_row[:2] *= -1
+
     scale_factor = -ro_time if pe_dir.endswith("-") else ro_time
 
-    fmap_nii = nb.Nifti1Image(vsm / scale_factor, xyz_nii.affine)
+    # Project displacements and scale to Hz in a single pass over the data
+    vsm = (xyz_deltas @ (inv_row / scale_factor).astype("float32")).reshape(
+        xyz_nii.shape[:3]
+    )
+
+    fmap_nii = nb.Nifti1Image(vsm, xyz_nii.affine)
     fmap_nii.header.set_intent("estimate", name="Delta_B0 [Hz]")
     fmap_nii.header.set_xyzt_units("mm")
     return fmap_nii
@@ -30,14 +30,14 @@ def au2rads(in_file, newpath=None):
     from nipype.utils.filemanip import fname_presuffix
 
     im = nb.load(in_file)
-    data = im.get_fdata(caching="unchanged")  # Read as float64 for safety
+    data = im.get_fdata(caching="unchanged", dtype="float32")
     hdr = im.header.copy()
 
-    # Rescale to [0, 2*pi]
-    data = (data - data.min()) * (2 * np.pi / (data.max() - data.min()))
-
-    # Round to float32 and clip
-    data = np.clip(np.float32(data), 0.0, 2 * np.pi)
+    # Rescale to [0, 2*pi] and clip, in a single buffer
+    vmin, vmax = data.min(), data.max()
+    data -= vmin
+    data *= 2 * np.pi / (vmax - vmin)
+    np.clip(data, 0.0, 2 * np.pi, out=data)
 
     hdr.set_data_dtype(np.float32)
     hdr.set_xyzt_units("mm")
@@ -47,12 +47,18 @@ def au2rads(in_file, newpath=None):
 
 
 def subtract_phases(in_phases, in_meta, newpath=None):
-    """Calculate the phase-difference map, given two input phase maps."""
+    """
+    Calculate the phase-difference map, given two input phase maps.
+
+    The input metadata dictionaries are not modified; a new dictionary
+    with the merged metadata is returned.
+
+    """
     import numpy as np
     import nibabel as nb
     from nipype.utils.filemanip import fname_presuffix
 
-    echo_times = tuple([m.pop("EchoTime", None) for m in in_meta])
+    echo_times = tuple([m.get("EchoTime", None) for m in in_meta])
     if echo_times[0] > echo_times[1]:
         in_phases = (in_phases[1], in_phases[0])
         in_meta = (in_meta[1], in_meta[0])
@@ -67,8 +73,8 @@ def subtract_phases(in_phases, in_meta, newpath=None):
     sub_data[sub_data < 0] += 2 * np.pi
     sub_data = np.clip(sub_data, 0.0, 2 * np.pi)
 
-    new_meta = in_meta[1].copy()
-    new_meta.update(in_meta[0])
+    new_meta = {**in_meta[1], **in_meta[0]}
+    new_meta.pop("EchoTime", None)
     new_meta["EchoTime1"] = echo_times[0]
     new_meta["EchoTime2"] = echo_times[1]
 
@@ -89,7 +95,8 @@ def phdiff2fmap(in_file, delta_te, newpath=None):
 
     out_file = fname_presuffix(str(in_file), suffix="_fmap", newpath=newpath)
     image = nb.load(in_file)
-    data = image.get_fdata(dtype="float32") / (2.0 * np.pi * delta_te)
+    data = image.get_fdata(dtype="float32")
+    data /= 2.0 * np.pi * delta_te
     nii = nb.Nifti1Image(data, image.affine, image.header)
     nii.set_data_dtype(np.float32)
     nii.to_filename(out_file)
@@ -24,7 +24,7 @@
 import numpy as np
 import nibabel as nb
 
-from ..phasemanip import au2rads, phdiff2fmap
+from ..phasemanip import au2rads, phdiff2fmap, subtract_phases
 
 
 def test_au2rads(tmp_path):
@@ -54,3 +54,22 @@ def test_phdiff2fmap(tmp_path):
     out_file = phdiff2fmap(tmp_path / "testdata.nii.gz", 2.46e-3)
 
     assert np.allclose(np.ones((5, 5, 5)), nb.load(out_file).get_fdata(dtype="float32"))
+
+
+def test_subtract_phases(tmp_path):
+    """Check the subtraction leaves input metadata untouched."""
+    for i, value in enumerate((1.0, 2.5)):
+        nb.Nifti1Image(
+            np.ones((5, 5, 5), dtype="float32") * value, np.eye(4)
+        ).to_filename(tmp_path / f"phase{i + 1}.nii.gz")
+
+    in_meta = ({"EchoTime": 0.00768, "Other": 1}, {"EchoTime": 0.00522})
+    out_file, out_meta = subtract_phases(
+        [tmp_path / "phase1.nii.gz", tmp_path / "phase2.nii.gz"],
+        in_meta,
+        newpath=str(tmp_path),
+    )
+
+    assert in_meta == ({"EchoTime": 0.00768, "Other": 1}, {"EchoTime": 0.00522})
+    assert out_meta == {"EchoTime1": 0.00522, "EchoTime2": 0.00768, "Other": 1}
+    assert np.allclose(nb.load(out_file).get_fdata(dtype="float32"), 2 * np.pi - 1.5)
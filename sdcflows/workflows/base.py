@@ -166,10 +166,10 @@ def init_fmap_preproc_wf(
                 ("outputnode.fmap_mask", "fmap_mask"),
                 ("outputnode.method", "method")
             ]),
+        ] + [
+            (out_map, mergenode, [(field, f"in{n}")])
+            for field, mergenode in out_merge.items()
         ])
         # fmt:on
 
-        for field, mergenode in out_merge.items():
-            workflow.connect(out_map, field, mergenode, f"in{n}")
-
     return workflow